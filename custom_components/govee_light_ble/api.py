@@ -1,4 +1,6 @@
 import asyncio
+from collections import deque
+
 import bleak_retry_connector
 from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak import (
@@ -17,14 +19,31 @@ from .api_utils import (
 import logging
 _LOGGER = logging.getLogger(__name__)
 
-
-def _scale_value(value: float, in_min: float, in_max: float, out_min: float, out_max: float) -> float:
-    """Scale value from one range to another while clamping to input bounds."""
-    if in_max == in_min:
-        return out_min
-    value = max(min(value, in_max), in_min)
-    ratio = (value - in_min) / (in_max - in_min)
-    return out_min + ratio * (out_max - out_min)
+#constant payload parts built once at import so the hot send paths
+#only splice in the variable bytes instead of rebuilding int lists
+_POWER_ON_PAYLOAD = b'\x01'
+_POWER_OFF_PAYLOAD = b'\x00'
+_SEGMENT_COLOR_PREFIX = bytes([LedColorType.SEGMENTS, 0x01])  # first segment
+_SEGMENT_COLOR_SUFFIX = bytes([0xFF] * 7)  # ensure segments stay lit
+_SINGLE_COLOR_PREFIX = bytes([LedColorType.SINGLE])
+_LEGACY_COLOR_PREFIX = bytes([LedColorType.LEGACY])
+
+#brightness scaling lookup tables, built once at import
+#segmented devices use 0-100, legacy devices 0-254; HA uses 0-255
+#the tables are 256 entries wide so any reported byte indexes safely
+_LUT_TO_SEG = bytes(round(i * 100 / 255) for i in range(256))
+_LUT_TO_LEG = bytes(round(i * 254 / 255) for i in range(256))
+_LUT_FROM_SEG = bytes(min(255, round(i * 255 / 100)) for i in range(256))
+_LUT_FROM_LEG = bytes(min(255, round(i * 255 / 254)) for i in range(256))
+
+#frames with fully constant payloads, built (checksum included) at import
+#so the common commands skip frame assembly at runtime entirely
+_FRAME_POWER_ON = GoveeUtils.generateFrame(LedPacket(LedPacketHead.COMMAND, LedPacketCmd.POWER, _POWER_ON_PAYLOAD))
+_FRAME_POWER_OFF = GoveeUtils.generateFrame(LedPacket(LedPacketHead.COMMAND, LedPacketCmd.POWER, _POWER_OFF_PAYLOAD))
+_FRAME_REQ_STATE = GoveeUtils.generateFrame(LedPacket(LedPacketHead.REQUEST, LedPacketCmd.POWER))
+_FRAME_REQ_BRIGHTNESS = GoveeUtils.generateFrame(LedPacket(LedPacketHead.REQUEST, LedPacketCmd.BRIGHTNESS))
+_FRAME_REQ_COLOR = GoveeUtils.generateFrame(LedPacket(LedPacketHead.REQUEST, LedPacketCmd.COLOR))
+_FRAME_REQ_SEGMENT = GoveeUtils.generateFrame(LedPacket(LedPacketHead.REQUEST, LedPacketCmd.SEGMENT, b'\x01'))  # first segment
 
 class GoveeAPI:
     state: bool | None = None
@@ -35,12 +54,14 @@ class GoveeAPI:
         self._conn = None
         self._ble_device = ble_device
         self._segmented = segmented
-        self._packet_buffer = []
+        self._packet_buffer = deque()
         self._client = None
+        self._known_connected = False
+        #scratch buffer reused for frame assembly, see generateFrame
+        self._frame_buf = bytearray(20)
         self._update_callback = update_callback
         self._connect_lock = asyncio.Lock()
         self._send_lock = asyncio.Lock()
-        self._buffer_lock = asyncio.Lock()
 
     @property
     def address(self):
@@ -48,117 +69,144 @@ class GoveeAPI:
 
     async def _ensureConnected(self):
         """ connects to a bluetooth device """
-        if self._client is not None and self._client.is_connected:
+        #trust the cached state, probing is_connected costs a DBus read
+        if self._known_connected:
             return None
         async with self._connect_lock:
+            if self._known_connected:
+                return None
             if self._client is not None and self._client.is_connected:
+                self._known_connected = True
                 return None
             await self._connect()
-    
+
     async def _connect(self):
-        self._client = await bleak_retry_connector.establish_connection(BleakClient, self._ble_device, self.address)
+        self._client = await bleak_retry_connector.establish_connection(
+            BleakClient,
+            self._ble_device,
+            self.address,
+            disconnected_callback=self._handleDisconnect
+        )
         await self._client.start_notify(READ_CHARACTERISTIC_UUID, self._handleReceive)
+        self._known_connected = True
+
+    def _handleDisconnect(self, client: BleakClient):
+        self._known_connected = False
+
+    def _applyPower(self, payload):
+        self.state = payload[0] == 0x01
+
+    def _applyBrightness(self, payload):
+        lut = _LUT_FROM_SEG if self._segmented else _LUT_FROM_LEG
+        self.brightness = lut[payload[0]]
+
+    def _applyColor(self, payload):
+        self.color = (payload[1], payload[2], payload[3])
 
-    async def _transmitPacket(self, packet: LedPacket):
-        """ transmit the actiual packet """
-        #convert to bytes
-        frame = await GoveeUtils.generateFrame(packet)
-        #transmit to UUID
-        await self._client.write_gatt_char(WRITE_CHARACTERISTIC_UUID, frame, False)
-
-    async def _handleRequest(self, packet: LedPacket):
-        """ process received responses """
-        match packet.cmd:
-            case LedPacketCmd.POWER:
-                self.state = packet.payload[0] == 0x01
-            case LedPacketCmd.BRIGHTNESS:
-                reported = packet.payload[0]
-                if self._segmented:
-                    scaled = _scale_value(reported, 0, 100, 0, 255)
-                else:
-                    # Legacy devices report 0-254; clamp to avoid leaking out of HA range
-                    scaled = _scale_value(reported, 0, 254, 0, 255)
-                self.brightness = int(round(max(0, min(255, scaled))))
-            case LedPacketCmd.COLOR:
-                red = packet.payload[1]
-                green = packet.payload[2]
-                blue = packet.payload[3]
-                self.color = (red, green, blue)
-            case LedPacketCmd.SEGMENT:
-                red = packet.payload[2]
-                green = packet.payload[3]
-                blue = packet.payload[4]
-                self.color = (red, green, blue)
+    def _applySegmentColor(self, payload):
+        self.color = (payload[2], payload[3], payload[4])
+
+    #single hash lookup per notification instead of a match/case chain
+    _HANDLERS = {
+        LedPacketCmd.POWER: _applyPower,
+        LedPacketCmd.BRIGHTNESS: _applyBrightness,
+        LedPacketCmd.COLOR: _applyColor,
+        LedPacketCmd.SEGMENT: _applySegmentColor,
+    }
 
     async def _handleReceive(self, characteristic: BleakGATTCharacteristic, frame: bytearray):
         """ receives packets async """
-        if not await GoveeUtils.verifyChecksum(frame):
+        #only requests are expected to send a response, bail before
+        #spending a checksum verification on anything else
+        if frame[0] != LedPacketHead.REQUEST:
+            return None
+        if not GoveeUtils.verifyChecksum(frame):
             raise Exception("transmission error, received packet with bad checksum")
-        
-        packet = LedPacket(
-            head=frame[0],
-            cmd=frame[1],
-            payload=frame[2:-1]
-        )
-        #only requests are expected to send a response
-        if packet.head == LedPacketHead.REQUEST:
-            await self._handleRequest(packet)
-            await self._update_callback()
-
-    async def _preparePacket(self, cmd: LedPacketCmd, payload: bytes | list = b'', request: bool = False, repeat: int = 3):
+        handler = self._HANDLERS.get(frame[1])
+        if handler is not None:
+            #memoryview reads the payload straight out of the
+            #notification buffer without copying it
+            handler(self, memoryview(frame)[2:-1])
+        await self._update_callback()
+
+    async def _preparePacket(self, cmd: LedPacketCmd, payload: bytes = b'', request: bool = False, repeat: int = 3):
         """ add data to transmission buffer """
         head = LedPacketHead.REQUEST if request else LedPacketHead.COMMAND
-        packet = LedPacket(head, cmd, payload)
-        async with self._buffer_lock:
-            for _ in range(repeat):
-                self._packet_buffer.append(packet)
+        #build the frame once at enqueue time, the buffer holds raw bytes
+        frame = GoveeUtils.generateFrame(LedPacket(head, cmd, payload), self._frame_buf)
+        self._enqueueFrame(frame, repeat)
+
+    def _enqueueFrame(self, frame: bytes, repeat: int = 3):
+        """ add a prebuilt frame to the transmission buffer """
+        #deque.extend is atomic on the single threaded loop, no lock needed
+        self._packet_buffer.extend([frame] * repeat)
 
     async def _clearPacketBuffer(self):
         """ clears the packet buffer """
-        self._packet_buffer = []
+        self._packet_buffer.clear()
 
     async def sendPacketBuffer(self):
         """ transmits all buffered data """
         async with self._send_lock:
-            async with self._buffer_lock:
-                if not self._packet_buffer:
-                    return None
-                packets = self._packet_buffer
-                self._packet_buffer = []
+            #snapshot under the lock so a failed flush requeues its frames
+            #before any waiting flush snapshots, preserving global order
+            if not self._packet_buffer:
+                return None
+            pending = list(self._packet_buffer)
+            self._packet_buffer.clear()
+            #duplicate request frames collapse into one write - the device answers
+            #a request once and a BLE write costs ~10ms - while command frames
+            #keep their repeat copies as deliberate retransmits
+            frames = []
+            previous = None
+            for frame in pending:
+                if frame == previous and frame[0] == LedPacketHead.REQUEST:
+                    continue
+                frames.append(frame)
+                previous = frame
             try:
                 await self._ensureConnected()
-                for packet in packets:
-                    await self._transmitPacket(packet)
+                #these are write-without-response, so no need to await the
+                #BlueZ round trip between frames - dispatch them as one batch
+                await asyncio.gather(*(
+                    self._client.write_gatt_char(WRITE_CHARACTERISTIC_UUID, frame, False)
+                    for frame in frames
+                ))
             except Exception:
-                async with self._buffer_lock:
-                    self._packet_buffer = packets + self._packet_buffer
+                #a failed write likely means the link dropped, re-probe next time
+                self._known_connected = False
+                #prepend the failed frames preserving their order
+                self._packet_buffer.extendleft(reversed(pending))
                 raise
             #not disconnecting seems to improve connection speed
+        #push the optimistically cached values so entity state tracks
+        #commands immediately, the coordinator poll still reconciles
+        await self._update_callback()
 
     async def requestStateBuffered(self):
         """ adds a request for the current power state to the transmit buffer """
-        await self._preparePacket(LedPacketCmd.POWER, request=True)
+        self._enqueueFrame(_FRAME_REQ_STATE)
 
     async def requestBrightnessBuffered(self):
         """ adds a request for the current brightness state to the transmit buffer """
-        await self._preparePacket(LedPacketCmd.BRIGHTNESS, request=True)
+        self._enqueueFrame(_FRAME_REQ_BRIGHTNESS)
 
     async def requestColorBuffered(self):
         """ adds a request for the current color state to the transmit buffer """
         if self._segmented:
-            #0x01 means first segment
-            await self._preparePacket(LedPacketCmd.SEGMENT, b'\x01', request=True)
+            self._enqueueFrame(_FRAME_REQ_SEGMENT)
         else:
             #legacy devices
-            await self._preparePacket(LedPacketCmd.COLOR, request=True)
-    
+            self._enqueueFrame(_FRAME_REQ_COLOR)
+
     async def setStateBuffered(self, state: bool):
         """ adds the state to the transmit buffer """
         if self.state == state:
             return None #nothing to do
-        #0x1 = ON, Ox0 = OFF
-        await self._preparePacket(LedPacketCmd.POWER, [0x1 if state else 0x0])
-        await self.requestStateBuffered()
+        self._enqueueFrame(_FRAME_POWER_ON if state else _FRAME_POWER_OFF)
+        #track the commanded value optimistically so the equality guards
+        #stay usable until the next coordinator poll reconciles
+        self.state = state
     
     async def setBrightnessBuffered(self, brightness: int, *, force: bool = False):
         """ adds the brightness to the transmit buffer """
@@ -167,33 +215,22 @@ class GoveeAPI:
         brightness = int(max(0, min(255, brightness)))
         if not force and self.brightness == brightness:
             return None #nothing to do
-        device_max = 100 if self._segmented else 254
-        payload = int(
-            round(_scale_value(brightness, 0, 255, 0, device_max))
-        )
-        payload = max(0, min(device_max, payload))
-        await self._preparePacket(LedPacketCmd.BRIGHTNESS, [payload])
-        await self.requestBrightnessBuffered()
+        lut = _LUT_TO_SEG if self._segmented else _LUT_TO_LEG
+        await self._preparePacket(LedPacketCmd.BRIGHTNESS, lut[brightness:brightness + 1])
+        self.brightness = brightness
         
     async def setColorBuffered(self, red: int, green: int, blue: int, *, force: bool = False):
         """ adds the color to the transmit buffer """
         if not force and self.color == (red, green, blue):
             return None #nothing to do
+        rgb = bytes((red, green, blue))
         if self._segmented:
-            segment_payload = [
-                LedColorType.SEGMENTS,
-                0x01,  # first segment
-                red,
-                green,
-                blue,
-                0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF  # ensure segments stay lit
-            ]
-            await self._preparePacket(LedPacketCmd.COLOR, segment_payload)
+            await self._preparePacket(LedPacketCmd.COLOR, _SEGMENT_COLOR_PREFIX + rgb + _SEGMENT_COLOR_SUFFIX)
             # also push legacy single-color payloads for broader compatibility
-            await self._preparePacket(LedPacketCmd.COLOR, [LedColorType.SINGLE, red, green, blue])
-            await self._preparePacket(LedPacketCmd.COLOR, [LedColorType.LEGACY, red, green, blue])
+            await self._preparePacket(LedPacketCmd.COLOR, _SINGLE_COLOR_PREFIX + rgb)
+            await self._preparePacket(LedPacketCmd.COLOR, _LEGACY_COLOR_PREFIX + rgb)
         else:
             #legacy devices
-            await self._preparePacket(LedPacketCmd.COLOR, [LedColorType.SINGLE, red, green, blue])
-            await self._preparePacket(LedPacketCmd.COLOR, [LedColorType.LEGACY, red, green, blue])
-        await self.requestColorBuffered()
+            await self._preparePacket(LedPacketCmd.COLOR, _SINGLE_COLOR_PREFIX + rgb)
+            await self._preparePacket(LedPacketCmd.COLOR, _LEGACY_COLOR_PREFIX + rgb)
+        self.color = (red, green, blue)
@@ -1,5 +1,7 @@
 from enum import IntEnum
 from dataclasses import dataclass
+from functools import reduce
+from operator import xor
 
 class LedPacketHead(IntEnum):
     COMMAND = 0x33
@@ -16,46 +18,47 @@ class LedColorType(IntEnum):
     SINGLE      = 0x02
     LEGACY      = 0x0D
 
-@dataclass
+#slots drop the per-instance __dict__, frozen allows reuse of constant packets
+@dataclass(slots=True, frozen=True)
 class LedPacket:
     #request data or perform a change
     head: LedPacketHead
     #data to request or command to perform
     cmd: LedPacketCmd
     #actual data to transmit
-    payload: bytes | list = b''
+    payload: bytes = b''
 
 class GoveeUtils:
     @staticmethod
-    async def generateChecksum(frame: bytes):
+    def generateChecksum(frame: bytes):
         """ returns checksum by XORing all data bytes """
-        checksum = 0
-        for b in frame:
-            checksum ^= b
-        #pad response to 8 bits
-        return bytes([checksum & 0xFF])
+        #reduce dispatches the XOR loop in C instead of one bytecode round per byte
+        #(benchmarked faster than an int.from_bytes shift-fold for 19 byte frames,
+        #and a JIT compiled kernel is not worth a native dependency here)
+        return bytes([reduce(xor, frame, 0) & 0xFF])
 
     @staticmethod
-    async def generateFrame(packet: LedPacket):
-        """ returns transmittable frame bytes """
+    def generateFrame(packet: LedPacket, buf: bytearray | None = None):
+        """ returns transmittable frame bytes
+
+        buf may be a reusable 20 byte scratch bytearray, the frame is
+        assembled in place and only copied once for the returned bytes
+        """
+        if buf is None:
+            buf = bytearray(20)
+        buf[0] = packet.head
         #pad cmd to 8 bits
-        cmd = packet.cmd & 0xFF
-        #combine segments
-        if isinstance(packet.payload, (bytes, bytearray)):
-            payload_bytes = bytes(packet.payload)
-        else:
-            payload_bytes = bytes(
-                int(max(0, min(255, round(value)))) for value in packet.payload
-            )
-        frame = bytes([packet.head, cmd]) + payload_bytes
+        buf[1] = packet.cmd & 0xFF
+        payload = packet.payload
+        end = 2 + len(payload)
+        buf[2:end] = payload
         #pad frame data to 19 bytes (plus checksum)
-        frame += bytes([0] * (19 - len(frame)))
+        for i in range(end, 19):
+            buf[i] = 0
         #add checksum to end
-        frame += await GoveeUtils.generateChecksum(frame)
-        return frame
+        buf[19] = reduce(xor, memoryview(buf)[:19], 0) & 0xFF
+        return bytes(buf)
 
     @staticmethod
-    async def verifyChecksum(frame: bytes):
-        checksum_received = frame[-1].to_bytes(1, 'big')
-        checksum_calculated = await GoveeUtils.generateChecksum(frame[:-1])
-        return checksum_received == checksum_calculated
+    def verifyChecksum(frame: bytes):
+        return frame[-1] == reduce(xor, frame[:-1], 0) & 0xFF
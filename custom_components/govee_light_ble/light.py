@@ -69,6 +69,9 @@ class GoveeBluetoothLight(CoordinatorEntity, LightEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn device on."""
+        # Always request power-on; the API's equality guard on its own
+        # (optimistically updated) cache makes this a no-op when already on,
+        # whereas coordinator.data can lag behind recent commands.
         await self.coordinator.setStateBuffered(True)
 
         was_off = not self.is_on
@@ -79,12 +82,19 @@ class GoveeBluetoothLight(CoordinatorEntity, LightEntity):
             # Use the last known brightness or fall back to full brightness so the strip lights up.
             current = self.brightness
             brightness = current if current not in (None, 0) else 255
-        await self.coordinator.setBrightnessBuffered(int(brightness), force=force_brightness)
-
-        if ATTR_RGB_COLOR in kwargs:
-            red, green, blue = kwargs.get(ATTR_RGB_COLOR)
+        brightness = int(brightness)
+        rgb = kwargs.get(ATTR_RGB_COLOR)
+
+        if force_brightness or brightness != self.brightness:
+            await self.coordinator.setBrightnessBuffered(brightness, force=force_brightness)
+        # Always honor an explicit color request - the cached color may lag
+        # behind the device, which is why the write stays forced.
+        if rgb is not None:
+            red, green, blue = rgb
             await self.coordinator.setColorBuffered(red, green, blue, force=True)
-        
+
+        # A redundant service call leaves the buffer empty and the flush
+        # returns without touching BLE.
         await self.coordinator.sendPacketBuffer()
 
     